@@ -53,6 +53,26 @@ class DoclingConverterApp:
         self.status_label = ttk.Label(main_frame, textvariable=self.status_var)
         self.status_label.pack(pady=10)
 
+        # Load the Docling converter in the background so the first conversion is warm
+        self.converter = None
+        self.converter_error = None
+        self.converter_ready = threading.Event()
+        threading.Thread(target=self.load_converter, daemon=True).start()
+
+    def load_converter(self):
+        try:
+            from docling.datamodel.base_models import InputFormat
+            from docling.document_converter import DocumentConverter
+
+            converter = DocumentConverter()
+            # Build the PDF pipeline now so its models are loaded before the first click
+            converter.initialize_pipeline(InputFormat.PDF)
+            self.converter = converter
+        except Exception as e:
+            self.converter_error = e
+        finally:
+            self.converter_ready.set()
+
     def browse_file(self):
         filetypes = [
             ("All supported", "*.pdf *.docx *.pptx *.xlsx *.html *.htm *.png *.jpg *.jpeg *.tiff *.bmp"),
@@ -100,10 +120,11 @@ class DoclingConverterApp:
 
     def do_conversion(self, input_path, output_path):
         try:
-            from docling.document_converter import DocumentConverter
+            self.converter_ready.wait()
+            if self.converter is None:
+                raise self.converter_error
 
-            converter = DocumentConverter()
-            result = converter.convert(input_path)
+            result = self.converter.convert(input_path)
             markdown_content = result.document.export_to_markdown()
 
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -148,9 +148,9 @@ ipcMain.handle('start-conversion', async (event, { inputPaths, outputFolder }) =
 
     let args;
     if (isDev) {
-      args = [converterScript, '--input', ...inputPaths, '--output', outputFolder];
+      args = [converterScript, '--input', ...inputPaths, '--output', outputFolder, '--emit-results'];
     } else {
-      args = ['--input', ...inputPaths, '--output', outputFolder];
+      args = ['--input', ...inputPaths, '--output', outputFolder, '--emit-results'];
     }
 
     console.log('Command:', pythonPath);
@@ -11,15 +11,53 @@ Outputs JSON progress to stdout for IPC with Electron.
 """
 
 import argparse
+import atexit
+import filecmp
+import gc
+import hashlib
+import importlib.util
+import itertools
 import json
+import multiprocessing
 import os
+import queue
+import shutil
+import signal
 import sys
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data).encode('utf-8')
 
 # Supported file extensions
-SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.pptx', '.xlsx', '.html', '.htm',
-                        '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'}
+SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.docx', '.pptx', '.xlsx', '.html', '.htm',
+                                  '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'})
+_MAX_EXTENSION_LENGTH = max(len(ext) for ext in SUPPORTED_EXTENSIONS)
+
+# Status lines are written by a background thread so conversion never blocks on the pipe
+_STDOUT = sys.stdout.buffer
+_STATUS_QUEUE = queue.SimpleQueue()
+_MAX_LINES_PER_WRITE = 64
+_status_writer = None
+_status_writer_lock = threading.Lock()
+
+# Shared DocumentConverter, created on first use (model loading is expensive)
+_CONVERTER = None
+# Full garbage collection (and CUDA cache release) after this many converted documents
+_GC_EVERY = 32
+_converted_since_gc = 0
+# Pipeline settings: {"fast": bool, "ocr": bool, "device": str}, plus "num_threads" in pool workers
+_CONVERTER_OPTIONS = {}
 
 
 def emit_status(status: str, message: str = "", file: str = "",
@@ -33,83 +71,766 @@ def emit_status(status: str, message: str = "", file: str = "",
         "total": total,
         "error": error
     }
-    print(json.dumps(data), flush=True)
+    write_json(data)
 
 
-def get_unique_output_path(output_path: Path) -> Path:
-    """Generate unique filename if file already exists (file.md -> file_1.md -> file_2.md)."""
-    if not output_path.exists():
-        return output_path
+def write_json(data: dict):
+    """Queue one JSON line for the stdout writer thread."""
+    global _status_writer
+    if _status_writer is None:
+        # Started on first use so worker processes importing this module don't get one
+        with _status_writer_lock:
+            if _status_writer is None:
+                _status_writer = threading.Thread(target=_drain_status_queue, daemon=True)
+                _status_writer.start()
+                atexit.register(_close_status_writer)
+    _STATUS_QUEUE.put(_dumps(data) + b'\n')
 
-    base = output_path.stem
-    ext = output_path.suffix
-    parent = output_path.parent
-    counter = 1
 
+def _drain_status_queue():
+    """Write queued status lines, coalescing whatever is waiting into one write and flush."""
     while True:
-        new_path = parent / f"{base}_{counter}{ext}"
-        if not new_path.exists():
-            return new_path
-        counter += 1
-
-
-def collect_files(input_paths: List[str]) -> List[Path]:
-    """Collect all files to convert from input paths (files or directories)."""
-    files = []
-
+        lines = [_STATUS_QUEUE.get()]
+        while lines[-1] is not None and len(lines) < _MAX_LINES_PER_WRITE:
+            try:
+                lines.append(_STATUS_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        done = lines[-1] is None
+        if done:
+            lines.pop()
+        if lines:
+            _STDOUT.write(b''.join(lines))
+            _STDOUT.flush()
+        if done:
+            return
+
+
+def _close_status_writer():
+    """Write out any queued status lines before the process exits."""
+    _STATUS_QUEUE.put(None)
+    _status_writer.join()
+
+
+def try_open_exclusive(output_path: str) -> Tuple[int, Path]:
+    """Atomically create a unique output file (file.md -> file_1.md -> file_2.md), returning (fd, path)."""
+    base, ext = os.path.splitext(output_path)
+    candidate = output_path
+    counter = 0
+    while True:
+        try:
+            fd = os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            return fd, Path(candidate)
+        except FileExistsError:
+            counter += 1
+            candidate = f"{base}_{counter}{ext}"
+
+
+def _scan_dir(directory: str):
+    """List one directory, returning (matching file paths, subdirectory paths)."""
+    matches = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                # Same rule as Path.suffix (dotfiles have no suffix), without building a Path
+                name = entry.name
+                dot = name.rfind('.')
+                if dot <= 0 or len(name) - dot > _MAX_EXTENSION_LENGTH:
+                    continue
+                ext = name[dot:]
+                # Most names are already lower case; only fold case on a miss
+                if (ext in SUPPORTED_EXTENSIONS or ext.lower() in SUPPORTED_EXTENSIONS) and entry.is_file():
+                    matches.append(entry.path)
+    except OSError:
+        pass
+    return matches, subdirs
+
+
+def scan_directory(root: Path) -> Iterator[Path]:
+    """Recursively yield supported files under root, scanning subdirectories in parallel."""
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        pending = {pool.submit(_scan_dir, str(root))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                matches, subdirs = future.result()
+                pending.update(pool.submit(_scan_dir, subdir) for subdir in subdirs)
+                # Directories finish in arbitrary order; sort within each so naming is deterministic
+                for match in sorted(matches):
+                    yield Path(match)
+
+
+def iter_files(input_paths: List[str]) -> Iterator[Path]:
+    """Lazily yield all files to convert from input paths (files or directories)."""
     for input_path in input_paths:
         path = Path(input_path)
 
         if path.is_file():
             if path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                files.append(path)
+                yield path
             else:
                 emit_status("warning", f"Unsupported file format: {path.suffix}", str(path))
         elif path.is_dir():
             # Recursively collect files from directory
-            for file_path in path.rglob('*'):
-                if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                    files.append(file_path)
+            yield from scan_directory(path)
         else:
             emit_status("error", f"Path does not exist: {input_path}", input_path)
 
-    return files
-
 
-def get_output_path(input_file: Path, input_base: Path, output_dir: Path) -> Path:
-    """Calculate output path maintaining directory structure."""
+class FileFeed:
+    """Walk input paths on a background thread, feeding a bounded queue and counting files found."""
+
+    def __init__(self, input_paths: List[str], maxsize: int = 1024):
+        self.found = 0
+        self.done = threading.Event()
+        self._queue = queue.Queue(maxsize)
+        threading.Thread(target=self._walk, args=(input_paths,), daemon=True).start()
+
+    def _walk(self, input_paths: List[str]):
+        try:
+            for path in iter_files(input_paths):
+                self.found += 1
+                self._queue.put(path)
+            if self.found:
+                emit_status("ready", f"Found {self.found} file(s) to convert", total=self.found)
+        finally:
+            self.done.set()
+            self._queue.put(None)
+
+    def __iter__(self) -> Iterator[Path]:
+        while True:
+            path = self._queue.get()
+            if path is None:
+                return
+            yield path
+
+
+def fingerprint(path: Path) -> Tuple[str, int, str]:
+    """Cheap content fingerprint: extension, file size and a hash of the first 64 KiB."""
+    with open(path, 'rb') as f:
+        head = f.read(65536)
+        size = os.fstat(f.fileno()).st_size
+    # Docling picks the backend partly by extension, so only same-type files can share output
+    return path.suffix.lower(), size, hashlib.blake2b(head, digest_size=16).hexdigest()
+
+
+class Deduplicator:
+    """Drop files whose content matches an earlier file, remembering them so their output can be copied."""
+
+    def __init__(self, lookahead: int = 32):
+        self.lookahead = lookahead
+        # fingerprint -> files converted with that fingerprint
+        self._seen = {}
+        # converted file -> duplicates waiting for its output
+        self.duplicates = {}
+        # filter() may run on the converter's thread while outcomes are copied on another
+        self._lock = threading.Lock()
+
+    def _original_of(self, input_file: Path, key) -> Optional[Path]:
+        for original in self._seen.get(key, ()):
+            # Fingerprints only cover the first 64 KiB; confirm with a full comparison
+            if filecmp.cmp(original, input_file, shallow=False):
+                return original
+        return None
+
+    def filter(self, files: Iterable[Path]) -> Iterator[Path]:
+        """Yield only the first file of each distinct content, hashing ahead on a thread pool."""
+        with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+            # Files are pulled on a separate thread so the head is yielded as soon as it is hashed,
+            # without waiting for the walk to find a full lookahead of files
+            pending = queue.Queue(self.lookahead)
+            threading.Thread(target=self._hash_ahead, args=(files, pool, pending), daemon=True).start()
+            while True:
+                item = pending.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+
+                input_file, future = item
+                try:
+                    key = future.result()
+                    original = self._original_of(input_file, key)
+                except OSError:
+                    # Unreadable here; let Docling report the problem
+                    yield input_file
+                    continue
+
+                if original is None:
+                    self._seen.setdefault(key, []).append(input_file)
+                    yield input_file
+                else:
+                    with self._lock:
+                        self.duplicates.setdefault(original, []).append(input_file)
+
+    @staticmethod
+    def _hash_ahead(files: Iterable[Path], pool: ThreadPoolExecutor, pending: queue.Queue):
+        """Start fingerprinting files as they arrive, at most pending's size ahead of filter()."""
+        try:
+            for input_file in files:
+                pending.put((input_file, pool.submit(fingerprint, input_file)))
+            pending.put(None)
+        except BaseException as e:
+            pending.put(e)
+
+    def copy_outputs(self, outcomes, outputs: 'OutputPaths'):
+        """Pass outcomes through, copying the output to each duplicate once its original is done."""
+        finished = {}
+        for input_file, output_file, error in outcomes:
+            yield input_file, output_file, error
+            finished[input_file] = (output_file, error)
+            yield from self._copy(input_file, output_file, error, outputs)
+
+        # Duplicates found after their original had already finished
+        for original in list(self.duplicates):
+            output_file, error = finished[original]
+            yield from self._copy(original, output_file, error, outputs)
+
+    def _copy(self, original: Path, output_file: Path, error: str, outputs: 'OutputPaths'):
+        with self._lock:
+            duplicates = self.duplicates.pop(original, [])
+        for duplicate in duplicates:
+            if error:
+                yield duplicate, output_file, error
+                continue
+
+            # A real copy, not a hard link: each output must stay independently editable
+            duplicate_output = outputs.reserve(duplicate)
+            try:
+                write_markdown(duplicate_output, output_file.read_text(encoding='utf-8'))
+            except OSError as e:
+                _log_exception()
+                outputs.discard(duplicate_output)
+                yield duplicate, duplicate_output, str(e)
+                continue
+            outputs.finish(duplicate_output)
+            yield duplicate, duplicate_output, ""
+
+
+def output_path_for(input_file: Path, input_base: Path, output_dir: Path) -> str:
+    """Calculate the Markdown path for input_file, maintaining directory structure."""
+    # Lexical prefix check on plain strings; os.path.relpath would stat the cwd for every file
+    input_path = os.fspath(input_file)
+    base = os.fspath(input_base)
+    if base == os.curdir and not os.path.isabs(input_path):
+        relative = input_path
+    else:
+        prefix = base if base.endswith(os.sep) else base + os.sep
+        if input_path.startswith(prefix):
+            # Get relative path from input base
+            relative = input_path[len(prefix):]
+        else:
+            # File is not relative to input_base, just use filename
+            relative = os.path.basename(input_path)
+
+    return os.path.join(output_dir, os.path.splitext(relative)[0] + '.md')
+
+
+class OutputPaths:
+    """Decide where each input's Markdown goes, and reserve and clean up output files.
+
+    Normally each output gets a unique numbered name, reserved on disk before conversion.
+    With overwrite, outputs are replaced once their new content is fully written; names are
+    claimed in memory instead, so inputs that share a stem (a.pdf, a.docx) still get
+    separate files (a.md, a_1.md) in a stable order from run to run.
+    """
+
+    def __init__(self, input_base: Path, output_dir: Path, overwrite: bool = False):
+        self.input_base = input_base
+        self.output_dir = output_dir
+        self.overwrite = overwrite
+        self._claimed = {}
+        self._claimed_paths = set()
+        # Reserved outputs not yet written or discarded
+        self._unfinished = set()
+        self._lock = threading.Lock()
+
+    def path_for(self, input_file: Path) -> str:
+        """Return the output path for input_file; with overwrite, the name claimed for it this run."""
+        output_path = output_path_for(input_file, self.input_base, self.output_dir)
+        if not self.overwrite:
+            return output_path
+        with self._lock:
+            claimed = self._claimed.get(input_file)
+            if claimed is None:
+                base, ext = os.path.splitext(output_path)
+                claimed = output_path
+                counter = 0
+                while claimed in self._claimed_paths:
+                    counter += 1
+                    claimed = f"{base}_{counter}{ext}"
+                self._claimed[input_file] = claimed
+                self._claimed_paths.add(claimed)
+            return claimed
+
+    def reserve(self, input_file: Path) -> Path:
+        """Return the output path for input_file, creating its directory and (normally) the file."""
+        output_path = self.path_for(input_file)
+
+        # Ensure output directory exists
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        if self.overwrite:
+            path = Path(output_path)
+        else:
+            fd, path = try_open_exclusive(output_path)
+            os.close(fd)
+        with self._lock:
+            self._unfinished.add(path)
+        return path
+
+    def finish(self, output_file: Path):
+        """Mark a reserved output as written."""
+        with self._lock:
+            self._unfinished.discard(output_file)
+
+    def discard(self, output_file: Path):
+        """Clean up after a failed conversion: drop our reservation, never a previous output."""
+        with self._lock:
+            self._unfinished.discard(output_file)
+        if not self.overwrite:
+            output_file.unlink(missing_ok=True)
+
+    def discard_unfinished(self):
+        """Remove placeholders and temp files of outputs still in progress, e.g. when the run is cancelled.
+
+        Left behind, an empty placeholder would push every later run's output to a numbered name.
+        """
+        with self._lock:
+            unfinished = list(self._unfinished)
+        for output_file in unfinished:
+            self.discard(output_file)
+            temp_path_for(output_file).unlink(missing_ok=True)
+
+
+def skip_unchanged(files: Iterable[Path], outputs: OutputPaths, skipped: List[Path]) -> Iterator[Path]:
+    """Yield files whose Markdown is missing or older than the input; collect the rest in skipped."""
+    for input_file in files:
+        output_path = outputs.path_for(input_file)
+        try:
+            if os.stat(output_path).st_mtime >= os.stat(input_file).st_mtime:
+                skipped.append(input_file)
+                emit_status("skipped", f"Up to date: {input_file.name}", str(input_file))
+                continue
+        except OSError:
+            pass
+        yield input_file
+
+
+def _get_converter():
+    """Return the shared DocumentConverter, creating it on first call."""
+    global _CONVERTER
+    if _CONVERTER is None:
+        from docling.datamodel.settings import settings
+
+        # Optional batch tuning for convert_all()
+        if os.environ.get('DOCLING_DOC_BATCH_SIZE'):
+            settings.perf.doc_batch_size = int(os.environ['DOCLING_DOC_BATCH_SIZE'])
+        if os.environ.get('DOCLING_PAGE_BATCH_CONCURRENCY'):
+            settings.perf.page_batch_concurrency = int(os.environ['DOCLING_PAGE_BATCH_CONCURRENCY'])
+
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import (AcceleratorDevice, AcceleratorOptions,
+                                                        PdfPipelineOptions, TableFormerMode)
+        from docling.document_converter import DocumentConverter, ImageFormatOption, PdfFormatOption
+
+        pipeline_options = PdfPipelineOptions()
+        pipeline_options.do_ocr = _CONVERTER_OPTIONS.get('ocr', True)
+        if _CONVERTER_OPTIONS.get('fast'):
+            pipeline_options.table_structure_options.mode = TableFormerMode.FAST
+        accelerator_options = AcceleratorOptions(
+            device=AcceleratorDevice(_CONVERTER_OPTIONS.get('device', 'auto')))
+        if _CONVERTER_OPTIONS.get('num_threads'):
+            accelerator_options.num_threads = _CONVERTER_OPTIONS['num_threads']
+        pipeline_options.accelerator_options = accelerator_options
+
+        # Images run through the same page pipeline, so they take the same options
+        _CONVERTER = DocumentConverter(format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options),
+            InputFormat.IMAGE: ImageFormatOption(pipeline_options=pipeline_options),
+        })
+    return _CONVERTER
+
+
+def result_markdown(result) -> str:
+    """Export a Docling conversion result to Markdown, raising if the conversion failed."""
+    from docling.datamodel.base_models import ConversionStatus
+
+    if result.status not in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS):
+        errors = "; ".join(err.error_message for err in result.errors)
+        raise RuntimeError(errors or f"Conversion failed with status: {result.status}")
+
+    return result.document.export_to_markdown()
+
+
+def temp_path_for(output_file: Path) -> Path:
+    """Hidden file next to output_file that its Markdown is written to before being moved into place."""
+    return output_file.with_name(f".{output_file.name}.tmp")
+
+
+def write_markdown(output_file: Path, markdown_content: str):
+    """Write Markdown next to output_file, then move it into place so a reader never sees a partial file."""
+    temp_path = temp_path_for(output_file)
+    # Output names are unique within a run, so a temp file left by a killed run can be reused
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        # Get relative path from input base
-        relative = input_file.relative_to(input_base)
-        output_path = output_dir / relative.with_suffix('.md')
-    except ValueError:
-        # File is not relative to input_base, just use filename
-        output_path = output_dir / input_file.with_suffix('.md').name
+        # Single encoded write through a large buffer keeps syscalls down for big documents
+        with open(fd, 'wb', buffering=1 << 20) as f:
+            f.write(markdown_content.encode('utf-8'))
+        os.replace(temp_path, output_file)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
 
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+def export_result(result, output_file: Path):
+    """Write a Docling conversion result to a Markdown file, raising if the conversion failed."""
+    write_markdown(output_file, result_markdown(result))
 
-    return get_unique_output_path(output_path)
 
+def _log_exception():
+    import traceback
+    error_details = traceback.format_exc()
+    print(f"DEBUG ERROR:\n{error_details}", file=sys.stderr, flush=True)
 
-def convert_file(input_file: Path, output_file: Path) -> bool:
-    """Convert a single file to Markdown using Docling."""
+
+def _pin_worker(worker_id: int, workers: int) -> int:
+    """Pin this worker to its own share of the CPUs (Linux only) to limit cross-core cache thrash.
+
+    Returns the number of CPUs in the worker's share.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return max(1, (os.cpu_count() or 1) // workers)
+    cpus = sorted(os.sched_getaffinity(0))
+    share = max(1, len(cpus) // workers)
+    slot = worker_id % workers
+    worker_cpus = cpus[slot * share:(slot + 1) * share] or [cpus[worker_id % len(cpus)]]
+    try:
+        os.sched_setaffinity(0, worker_cpus)
+    except OSError:
+        pass
+    return len(worker_cpus)
+
+
+def release_memory():
+    """Count a finished document and periodically return Docling's page buffers to the OS."""
+    global _converted_since_gc
+    _converted_since_gc += 1
+    if _converted_since_gc < _GC_EVERY:
+        return
+    _converted_since_gc = 0
+
+    gc.collect()
+    # Only touch torch if Docling already loaded it
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _exit_with_parent(parent):
+    """Stop this worker once the parent process is gone.
+
+    The worker holds both ends of the pool's call queue, so it would otherwise wait for work forever.
+    """
+    parent.join()
+    os._exit(1)
+
+
+def _init_worker(options: dict, worker_ids, workers: int):
+    """Process pool initializer: pin the worker and load the converter once per worker process."""
+    parent = multiprocessing.parent_process()
+    if parent is not None:
+        threading.Thread(target=_exit_with_parent, args=(parent,), daemon=True).start()
+
+    with worker_ids.get_lock():
+        worker_id = worker_ids.value
+        worker_ids.value += 1
+    num_threads = _pin_worker(worker_id, workers)
+
+    # Size torch/OpenMP thread pools to this worker's CPUs instead of the whole machine;
+    # the environment variable must be set before Docling imports torch
+    os.environ['OMP_NUM_THREADS'] = str(num_threads)
+    _CONVERTER_OPTIONS.update(options, num_threads=num_threads)
     try:
-        from docling.document_converter import DocumentConverter
+        _get_converter()
+    except Exception:
+        # Leave the pool usable; convert_file() retries and reports the error per file
+        pass
 
-        converter = DocumentConverter()
-        result = converter.convert(str(input_file))
-        markdown_content = result.document.export_to_markdown()
+    torch = sys.modules.get('torch')
+    if torch is not None:
+        torch.set_num_threads(num_threads)
 
-        output_file.write_text(markdown_content, encoding='utf-8')
-        return True
 
+def convert_file(input_file: Path, output_file: Path) -> str:
+    """Convert a single file to Markdown in a worker process. Returns an error message, or "" on success."""
+    result = None
+    try:
+        result = _get_converter().convert(str(input_file), raises_on_error=False)
+        export_result(result, output_file)
+        return ""
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"DEBUG ERROR:\n{error_details}", file=sys.stderr, flush=True)
-        emit_status("error", str(e), str(input_file), error=str(e))
+        _log_exception()
+        return str(e)
+    finally:
+        # The result holds page images and layout data; drop it before the next file
+        del result
+        release_memory()
+
+
+def convert_pages(input_file: Path, page_range: Tuple[int, int]) -> Tuple[str, str]:
+    """Convert a page range of a PDF in a worker process. Returns (markdown, error message)."""
+    result = None
+    try:
+        result = _get_converter().convert(str(input_file), raises_on_error=False,
+                                          page_range=page_range)
+        return result_markdown(result), ""
+    except Exception as e:
+        _log_exception()
+        return "", str(e)
+    finally:
+        del result
+        release_memory()
+
+
+def split_pages(input_file: Path, page_batch_size: int) -> List[Tuple[int, int]]:
+    """Page ranges (1-based, inclusive) for a PDF longer than page_batch_size, else []."""
+    if page_batch_size <= 0 or input_file.suffix.lower() != '.pdf':
+        return []
+    try:
+        import pypdfium2
+        pdf = pypdfium2.PdfDocument(str(input_file))
+        try:
+            page_count = len(pdf)
+        finally:
+            pdf.close()
+    except Exception:
+        # Unreadable here; let Docling report the problem when converting the whole file
+        return []
+
+    if page_count <= page_batch_size:
+        return []
+    return [(start, min(start + page_batch_size - 1, page_count))
+            for start in range(1, page_count + 1, page_batch_size)]
+
+
+def cuda_likely_available() -> bool:
+    """Cheap CUDA probe: torch is installed and an NVIDIA driver is present (without importing torch)."""
+    if importlib.util.find_spec('torch') is None:
         return False
+    return os.path.exists('/proc/driver/nvidia/version') or shutil.which('nvidia-smi') is not None
+
+
+def default_workers(device: str = 'auto') -> int:
+    """One worker per spare CPU core, or a single worker when a CUDA GPU is shared."""
+    if device == 'cuda' or (device == 'auto' and cuda_likely_available()):
+        return 1
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def announce(files: Iterable[Path], feed: FileFeed) -> Iterator[Path]:
+    """Pass files through, emitting a "converting" event as each one is picked up."""
+    for idx, input_file in enumerate(files, 1):
+        emit_status("converting", f"Converting: {input_file.name}",
+                   str(input_file), progress=idx, total=feed.found)
+        yield input_file
+
+
+def convert_in_process(files: Iterable[Path], outputs: OutputPaths):
+    """Convert files with the shared converter, yielding (input_file, output_file, error).
+
+    Docling runs on a background thread and each document is exported and written on another,
+    so an outcome is reported as soon as its file is written rather than after the next conversion.
+    """
+    converter = _get_converter()
+    outcomes = queue.SimpleQueue()
+    # At most one finished document waits to be written while the next one converts
+    write_slot = threading.Semaphore(1)
+
+    def write(result, input_file: Path, output_file: Path):
+        try:
+            export_result(result, output_file)
+            outputs.finish(output_file)
+            outcomes.put((input_file, output_file, ""))
+        except Exception as e:
+            _log_exception()
+            outputs.discard(output_file)
+            outcomes.put((input_file, output_file, str(e)))
+        finally:
+            del result
+            release_memory()
+            write_slot.release()
+
+    # Files handed to Docling that have no result yet
+    in_docling = deque()
+
+    def track(source: Iterator[Path]) -> Iterator[Path]:
+        for input_file in source:
+            in_docling.append(input_file)
+            yield input_file
+
+    def convert():
+        source = iter(files)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                while True:
+                    try:
+                        # Stream the files through Docling as they are found; results come back in input order
+                        for result in converter.convert_all(track(source), raises_on_error=False):
+                            input_file = Path(result.input.file)
+                            while in_docling and in_docling.popleft() != input_file:
+                                pass
+                            output_file = outputs.reserve(input_file)
+                            write_slot.acquire()
+                            writer.submit(write, result, input_file, output_file)
+                            # The writer holds the only remaining reference, so page data is freed once it's written
+                            del result
+                        break
+                    except OSError as e:
+                        # Docling reads each file to detect its format outside its per-document
+                        # error handling, so an unreadable file ends convert_all() altogether
+                        if not in_docling:
+                            raise
+                        _log_exception()
+                        outcomes.put((in_docling.pop(), None, str(e)))
+                        # Give Docling the rest of the batch it dropped, then carry on with the others
+                        source = itertools.chain(list(in_docling), source)
+                        in_docling.clear()
+            outcomes.put(None)
+        except BaseException as e:
+            outcomes.put(e)
+
+    threading.Thread(target=convert, daemon=True).start()
+    while True:
+        outcome = outcomes.get()
+        if outcome is None:
+            return
+        if isinstance(outcome, BaseException):
+            raise outcome
+        yield outcome
+
+
+def _terminate_workers(pool: ProcessPoolExecutor):
+    """Stop a pool without waiting for in-flight documents to finish."""
+    # No public API for this before Python 3.14
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def convert_in_pool(files: Iterable[Path], outputs: OutputPaths, workers: int,
+                    page_batch_size: int = 0):
+    """Convert files across worker processes, yielding (input_file, output_file, error) as they finish.
+
+    PDFs longer than page_batch_size pages are split into page ranges converted in parallel,
+    and the Markdown of the ranges is joined in page order.
+    """
+    # Never fork the parent directly: it is running directory-walker threads
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+    else:
+        context = multiprocessing.get_context('spawn')
+    worker_ids = context.Value('i', 0)
+
+    # One long-lived pool for the whole run; each worker keeps its converter and models loaded
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                             initargs=(_CONVERTER_OPTIONS, worker_ids, workers)) as pool:
+        try:
+            # future -> (input_file, output_file, split job or None, chunk index, page range)
+            futures = {}
+            files = iter(files)
+            # Set once a worker dies; the pool then accepts no more tasks
+            broken = ""
+            remaining = ()
+
+            while True:
+                # Keep a bounded number of tasks in flight so the walk streams into the pool
+                for input_file in files:
+                    # Reserve the name up front; workers write to it by path
+                    output_file = outputs.reserve(input_file)
+
+                    page_ranges = split_pages(input_file, page_batch_size)
+                    job = None
+                    try:
+                        if page_ranges:
+                            job = {"chunks": [""] * len(page_ranges), "remaining": 0, "error": ""}
+                            for index, page_range in enumerate(page_ranges):
+                                future = pool.submit(convert_pages, input_file, page_range)
+                                futures[future] = (input_file, output_file, job, index, page_range)
+                                job["remaining"] += 1
+                        else:
+                            future = pool.submit(convert_file, input_file, output_file)
+                            futures[future] = (input_file, output_file, None, 0, None)
+                    except BrokenProcessPool as e:
+                        broken = f"Converter worker stopped unexpectedly: {e}"
+                        if job and job["remaining"]:
+                            # Already-submitted page ranges fail and finish the job below
+                            job["error"] = broken
+                        else:
+                            outputs.discard(output_file)
+                            yield input_file, output_file, broken
+                        # Let in-flight tasks report their failures, then fail the rest
+                        remaining, files = files, iter(())
+                        break
+
+                    if len(futures) >= workers * 2:
+                        break
+
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    input_file, output_file, job, index, page_range = futures.pop(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        # Worker process died (e.g. out of memory)
+                        outcome = ("", str(e)) if job else str(e)
+
+                    if job is None:
+                        error = outcome
+                    else:
+                        job["chunks"][index], chunk_error = outcome
+                        job["error"] = job["error"] or chunk_error
+                        job["remaining"] -= 1
+                        emit_status("converted_pages",
+                                    f"Converted pages {page_range[0]}-{page_range[1]} of {input_file.name}",
+                                    str(input_file))
+                        if job["remaining"]:
+                            continue
+
+                        error = job["error"]
+                        if not error:
+                            try:
+                                write_markdown(output_file, "\n\n".join(job["chunks"]))
+                            except Exception as e:
+                                _log_exception()
+                                error = str(e)
+
+                    if error:
+                        outputs.discard(output_file)
+                    else:
+                        outputs.finish(output_file)
+                    yield input_file, output_file, error
+        except BaseException:
+            # Cancelled or abandoned: don't let leaving the with block wait on running conversions
+            _terminate_workers(pool)
+            raise
+
+        # Files the broken pool never accepted
+        for input_file in remaining:
+            yield input_file, None, broken
+
+
+def _exit_on_sigterm(signum, frame):
+    sys.exit(128 + signum)
 
 
 def main():
@@ -118,49 +839,118 @@ def main():
                         help='Input file(s) or folder(s)')
     parser.add_argument('--output', '-o', required=True,
                         help='Output directory')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help='Number of worker processes (default: CPU cores - 1, or 1 with CUDA)')
+    parser.add_argument('--emit-results', action=argparse.BooleanOptionalAction, default=False,
+                        help='Include per-file results in the final summary')
+    parser.add_argument('--fast', action='store_true',
+                        help='Use the fast TableFormer mode for PDF tables')
+    parser.add_argument('--no-ocr', action='store_true',
+                        help='Disable OCR for PDFs and images (faster; scanned pages yield no text)')
+    parser.add_argument('--device', choices=['auto', 'cpu', 'cuda', 'mps'], default='auto',
+                        help='Accelerator device for Docling models (default: auto)')
+    parser.add_argument('--page-batch-size', type=int, default=40,
+                        help='Split PDFs longer than this many pages across workers (0 to disable)')
+    parser.add_argument('--dedupe', action=argparse.BooleanOptionalAction, default=True,
+                        help='Convert identical files once and copy the output for the others')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip files whose Markdown output is newer than the input, '
+                             'and overwrite outputs instead of numbering them')
 
     args = parser.parse_args()
 
+    # Electron cancels a run with SIGTERM; unwind normally so worker processes are stopped too
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+
+    _CONVERTER_OPTIONS.update(fast=args.fast, ocr=not args.no_ocr, device=args.device)
+
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     emit_status("starting", "Collecting files...")
 
-    # Collect all files to convert
-    files = collect_files(args.input)
+    workers = max(1, args.workers or default_workers(args.device))
+
+    # Walk the inputs in the background; conversion starts as soon as the first file is found
+    feed = FileFeed(args.input)
+    files = iter(feed)
+    first_file = next(files, None)
 
-    if not files:
+    if first_file is None:
         emit_status("error", "No supported files found", error="No supported files found")
         sys.exit(1)
 
-    total = len(files)
-    emit_status("ready", f"Found {total} file(s) to convert", total=total)
-
     # Determine base path for relative output structure
     if len(args.input) == 1 and Path(args.input[0]).is_dir():
         input_base = Path(args.input[0])
     else:
         # For multiple files or single file, use parent directory
-        input_base = files[0].parent if files else Path('.')
+        input_base = first_file.parent
+
+    outputs = OutputPaths(input_base, output_dir, overwrite=args.incremental)
+
+    if feed.done.is_set() and feed.found < workers:
+        # Only a few files: size the pool to the work, counting each long PDF's page ranges
+        found = [first_file, *files]
+        tasks = sum(len(split_pages(input_file, args.page_batch_size)) or 1 for input_file in found)
+        workers = min(workers, tasks)
+        files = iter(found[1:])
+
+    files = itertools.chain([first_file], files)
+    skipped = []
+    if args.incremental:
+        files = skip_unchanged(files, outputs, skipped)
+    deduplicator = Deduplicator() if args.dedupe else None
+    if deduplicator:
+        files = deduplicator.filter(files)
+    files = announce(files, feed)
+
+    if workers > 1:
+        conversions = convert_in_pool(files, outputs, workers, args.page_batch_size)
+    else:
+        try:
+            _get_converter()
+        except Exception as e:
+            emit_status("error", f"Failed to initialize converter: {e}", error=str(e))
+            sys.exit(1)
+        conversions = convert_in_process(files, outputs)
+
+    outcomes = conversions
+    if deduplicator:
+        outcomes = deduplicator.copy_outputs(conversions, outputs)
 
     successful = 0
     failed = 0
     results = []
 
-    for idx, input_file in enumerate(files, 1):
-        emit_status("converting", f"Converting: {input_file.name}",
-                   str(input_file), progress=idx, total=total)
-
-        output_file = get_output_path(input_file, input_base, output_dir)
-
-        if convert_file(input_file, output_file):
-            successful += 1
-            results.append({"input": str(input_file), "output": str(output_file), "success": True})
-            emit_status("converted", f"Converted: {input_file.name}",
-                       str(input_file), progress=idx, total=total)
-        else:
-            failed += 1
-            results.append({"input": str(input_file), "output": "", "success": False})
+    try:
+        for idx, (input_file, output_file, error) in enumerate(outcomes, 1):
+            total = feed.found
+            if not error:
+                successful += 1
+                if args.emit_results:
+                    results.append({"input": str(input_file), "output": str(output_file), "success": True})
+                emit_status("converted", f"Converted: {input_file.name}",
+                           str(input_file), progress=len(skipped) + idx, total=total)
+            else:
+                failed += 1
+                if args.emit_results:
+                    results.append({"input": str(input_file), "output": "", "success": False})
+                emit_status("error", error, str(input_file), error=error)
+    except BaseException:
+        # Cancelled or failed: stop converting first so nothing recreates the files being removed
+        conversions.close()
+        outputs.discard_unfinished()
+        raise
+
+    total = feed.found
+
+    # Up-to-date files count as successes
+    successful += len(skipped)
+    if args.emit_results:
+        for input_file in skipped:
+            output_file = outputs.path_for(input_file)
+            results.append({"input": str(input_file), "output": output_file, "success": True})
 
     # Emit final summary
     summary = {
@@ -168,11 +958,14 @@ def main():
         "message": f"Conversion complete: {successful} succeeded, {failed} failed",
         "successful": successful,
         "failed": failed,
-        "total": total,
-        "results": results
+        "total": total
     }
-    print(json.dumps(summary), flush=True)
+    if args.emit_results:
+        summary["results"] = results
+    write_json(summary)
 
 
 if __name__ == '__main__':
+    # Required for worker processes in the PyInstaller-frozen executable
+    multiprocessing.freeze_support()
     main()
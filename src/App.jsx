@@ -39,6 +39,8 @@ function App() {
           current: data.progress,
           currentFile: data.file,
         }));
+      } else if (data.status === 'converted_pages' || data.status === 'skipped') {
+        setStatusMessage(data.message);
       } else if (data.status === 'complete') {
         setIsConverting(false);
         setStatusMessage(data.message);